@@ -1,12 +1,8 @@
 # aggregate_tendencies.py
 
-import pandas as pd
 from pathlib import Path
 
-
-MASTER_CSV    = "../data/out_master_accepted.csv"
-
-OUT_DIR  = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/data/"
+from ccai_paths import MASTER_CSV, OUT_DIR
 
 def explode_counts(df, column):
     """
@@ -25,6 +21,8 @@ def explode_counts(df, column):
     return counts
 
 def main(master_csv, out_dir):
+    import pandas as pd
+
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     df = pd.read_csv(master_csv)
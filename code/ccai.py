@@ -0,0 +1,203 @@
+# ccai.py
+"""
+Single entry point for the CCAI tendencies pipeline.
+
+    python ccai.py download
+    python ccai.py extract
+    python ccai.py aggregate
+    python ccai.py status
+
+Every subcommand imports its module (and the heavy deps behind it) only when
+it runs. Global flags:
+  --profile          run the subcommand under cProfile and print the top
+                     entries (or dump stats with --profile-out FILE)
+  --import-time      report how long the subcommand's module and each heavy
+                     package it pulled in (pandas, openai, ...) took to import
+
+--import-time measures from the moment ccai.py starts importing; interpreter
+startup is not included. For the full picture use `python -X importtime`.
+"""
+
+import time
+
+T0 = time.perf_counter()
+
+import argparse
+import builtins
+import importlib
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from ccai_paths import (
+    MAIN_URL, PAPERS_ROOT, METADATA_CSV, MASTER_CSV, RESUME_CSV, OUT_DIR
+)
+
+HEAVY_MODULES = ["openai", "pandas", "numpy", "requests", "bs4", "tqdm", "rapidfuzz"]
+
+
+def _import_timed(name, timings):
+    t = time.perf_counter()
+    mod = importlib.import_module(name)
+    timings.append((name, time.perf_counter() - t))
+    return mod
+
+
+@contextmanager
+def _track_heavy_imports(timings):
+    """
+    Times the first import of each package in HEAVY_MODULES while active.
+    Nested heavy imports (numpy under pandas) count toward the outer package.
+    """
+    real_import = builtins.__import__
+    active = []
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        top = name.partition(".")[0]
+        if level or active or top not in HEAVY_MODULES or top in sys.modules:
+            return real_import(name, globals, locals, fromlist, level)
+        active.append(top)
+        t = time.perf_counter()
+        try:
+            return real_import(name, globals, locals, fromlist, level)
+        finally:
+            timings.append((top, time.perf_counter() - t))
+            active.pop()
+
+    builtins.__import__ = timed_import
+    try:
+        yield
+    finally:
+        builtins.__import__ = real_import
+
+
+# -------------------
+# Subcommands
+# -------------------
+
+def cmd_download(args, timings):
+    mod = _import_timed("download_papers", timings)
+    mod.main(args.url, args.output_dir, args.meta_csv)
+
+
+def cmd_extract(args, timings):
+    mod = _import_timed("extract_papers_accepted", timings)
+    mod.process_all_pdfs(
+        args.papers_root, args.master_csv,
+        meta_csv=args.meta_csv, resume_csv=args.resume_csv,
+    )
+
+
+def cmd_aggregate(args, timings):
+    mod = _import_timed("aggregate_tendencies_accepted", timings)
+    mod.main(args.master_csv, args.out_dir)
+
+
+def _count_csv_rows(path):
+    import csv
+    with open(path, newline="", encoding="utf-8") as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+
+def cmd_status(args, timings):
+    """Quick look at pipeline outputs; uses only the standard library."""
+    papers_root = Path(args.papers_root)
+    if papers_root.is_dir():
+        n_pdfs = sum(1 for p in papers_root.rglob("*.pdf") if p.is_file())
+        print(f"PDFs:       {n_pdfs} under {papers_root}")
+    else:
+        print(f"PDFs:       (missing) {papers_root}")
+
+    for label, path in [("master CSV", args.master_csv), ("resume CSV", args.resume_csv)]:
+        path = Path(path)
+        if path.exists():
+            print(f"{label + ':':<11} {_count_csv_rows(path)} rows in {path}")
+        else:
+            print(f"{label + ':':<11} (missing) {path}")
+
+
+# -------------------
+# Argument parsing
+# -------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ccai", description="CCAI tendencies pipeline")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile the subcommand with cProfile")
+    parser.add_argument("--profile-out", default=None, metavar="FILE",
+                        help="dump cProfile stats to FILE instead of printing them")
+    parser.add_argument("--import-time", action="store_true",
+                        help="report import time and heavy packages loaded")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("download", help="scrape accepted works and download PDFs")
+    p.add_argument("--url", default=MAIN_URL)
+    p.add_argument("--output-dir", default=PAPERS_ROOT)
+    p.add_argument("--meta-csv", default=METADATA_CSV)
+    p.set_defaults(func=cmd_download)
+
+    p = sub.add_parser("extract", help="label PDFs with GPT and write the master CSV")
+    p.add_argument("--papers-root", default=PAPERS_ROOT)
+    p.add_argument("--master-csv", default=MASTER_CSV)
+    p.add_argument("--meta-csv", default=METADATA_CSV)
+    p.add_argument("--resume-csv", default=RESUME_CSV)
+    p.set_defaults(func=cmd_extract)
+
+    p = sub.add_parser("aggregate", help="count tendencies from the master CSV")
+    p.add_argument("--master-csv", default=MASTER_CSV)
+    p.add_argument("--out-dir", default=OUT_DIR)
+    p.set_defaults(func=cmd_aggregate)
+
+    p = sub.add_parser("status", help="show how far the pipeline has got")
+    p.add_argument("--papers-root", default=PAPERS_ROOT)
+    p.add_argument("--master-csv", default=MASTER_CSV)
+    p.add_argument("--resume-csv", default=RESUME_CSV)
+    p.set_defaults(func=cmd_status)
+
+    return parser
+
+
+def report_import_time(timings, heavy_before):
+    print(f"[import-time] ccai import to dispatch: {timings[0][1] * 1000:.1f} ms", file=sys.stderr)
+    for name, dt in timings[1:]:
+        print(f"[import-time] import {name}: {dt * 1000:.1f} ms", file=sys.stderr)
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules and m not in heavy_before]
+    print(f"[import-time] heavy packages loaded: {', '.join(loaded) or 'none'}", file=sys.stderr)
+
+
+def _run(args, timings):
+    if args.profile or args.profile_out:
+        import cProfile
+        import pstats
+        prof = cProfile.Profile()
+        try:
+            prof.runcall(args.func, args, timings)
+        finally:
+            if args.profile_out:
+                prof.dump_stats(args.profile_out)
+                print(f"Profile written to: {args.profile_out}", file=sys.stderr)
+            else:
+                pstats.Stats(prof, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+    else:
+        args.func(args, timings)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    timings = [("startup", time.perf_counter() - T0)]
+    heavy_before = {m for m in HEAVY_MODULES if m in sys.modules}
+
+    try:
+        if args.import_time:
+            with _track_heavy_imports(timings):
+                _run(args, timings)
+        else:
+            _run(args, timings)
+    finally:
+        if args.import_time:
+            report_import_time(timings, heavy_before)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# ccai_paths.py
+# Default locations shared by the pipeline scripts and ccai.py.
+
+MAIN_URL      = "https://www.climatechange.ai/events/neurips2025#accepted-works"
+PAPERS_ROOT   = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/final_papers_ccai"
+METADATA_CSV  = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/data/2025.11.11papers.xls.csv"
+MASTER_CSV    = "../data/out_master_accepted.csv"
+RESUME_CSV    = "../data/resume_accepted.csv"
+OUT_DIR       = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/data/"
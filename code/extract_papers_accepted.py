@@ -5,13 +5,9 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
-from tqdm.auto import tqdm
+# openai, pandas, tqdm and pdf_utils are imported where they are used, so
+# importing this module stays cheap and creates no API client
 
-
-
-from openai import OpenAI
-
-from pdf_utils import iter_pdf_chunks
 from prompt_template import SYSTEM_PROMPT, build_user_prompt
 from label_space import (
     TECHNIQUES, CLIMATE_AREAS, DATA_MODALITIES, TASKS, SUPERVISION, PARADIGMS,
@@ -20,16 +16,19 @@ from label_space import (
     CLIMATE_PURPOSE, MODEL_SCALE, COMPUTE_FOOTPRINT
 )
 
-import pandas as pd
-
 from metadata_utils_accepted import load_paper_metadata, load_paper_id_mapping
+from ccai_paths import PAPERS_ROOT, MASTER_CSV, RESUME_CSV, METADATA_CSV
 
-PAPERS_ROOT   = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/final_papers_ccai/"
-MASTER_CSV    = "../data/out_master_accepted.csv"
-RESUME_CSV    = "../data/resume_accepted.csv"
-METADATA_CSV  = "/mnt/data-r1/JoaquinSalas/Documents/informs/conferences/2025CCAI/data/2025.11.11papers.xls.csv"
+_client = None
 
-client = OpenAI()  # assumes OPENAI_API_KEY env var
+
+def get_client():
+    """Creates the OpenAI client on first use (assumes OPENAI_API_KEY env var)."""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI()
+    return _client
 
 # -------------------
 # Helpers
@@ -92,7 +91,7 @@ def pdf_to_paper_id_from_filename(pdf_path: Path) -> str:
 
 def call_gpt_for_chunk(paper_id, chunk_index, text_chunk, model="gpt-4.1-mini"):
     user_prompt = build_user_prompt(paper_id, chunk_index, text_chunk)
-    resp = client.chat.completions.create(
+    resp = get_client().chat.completions.create(
         model=model,
         response_format={"type": "json_object"},
         messages=[
@@ -149,6 +148,11 @@ def finalize_record(paper_id, merged_sets, meta_by_id=None):
 # -------------------
 
 def process_all_pdfs(pdf_dir, out_master_csv, meta_csv=None, resume_csv=None):
+    import pandas as pd
+    from tqdm.auto import tqdm
+
+    from pdf_utils import iter_pdf_chunks
+
     pdf_dir = Path(pdf_dir)
     out_master_csv = Path(out_master_csv)
     out_master_csv.parent.mkdir(parents=True, exist_ok=True)
@@ -1,5 +1,4 @@
 # metadata_utils.py
-import pandas as pd
 from subject_area_utils import parse_topic_area, parse_secondary_list, normalize_topic
 
 
@@ -17,6 +16,8 @@ def load_paper_metadata(meta_csv_path: str):
       - 'Status'
     Returns dict: paper_id(str) -> metadata dict
     """
+    import pandas as pd
+
     df = pd.read_csv(meta_csv_path, encoding="cp1252")
     meta = {}
 
@@ -72,6 +73,8 @@ def load_paper_id_mapping(meta_csv_path: str):
     Returns dict: paper_id (str) -> paper_id (str)
     Only for ACCEPTED papers.
     """
+    import pandas as pd
+
     df = pd.read_csv(meta_csv_path, encoding="cp1252")
 
     mapping = {}